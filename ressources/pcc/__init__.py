@@ -0,0 +1,40 @@
+"""
+Plus court chemin: shortest path engines for GTFS public transport graphs.
+
+The names below are imported on first access only, so that a query worker
+importing the engines never loads NumPy (delta-stepping, parallel loading)
+or matplotlib (plots) unless it uses them.
+"""
+from importlib import import_module
+
+_EXPORTS = {
+    'dijkstra': 'dijkstra_minheap',
+    'MinHeap': 'dijkstra_minheap',
+    'dijkstra_fibonacci': 'dijkstra_fibo',
+    'FibonacciHeap': 'dijkstra_fibo',
+    'bellman_ford': 'bellman_ford',
+    'yen_k_shortest_paths': 'k_shortest',
+    'penalty_alternatives': 'k_shortest',
+    'delta_stepping': 'delta_stepping',
+    'DeltaStepping': 'delta_stepping',
+    'CSRGraph': 'delta_stepping',
+    'OperationCounters': 'instrumentation',
+    'load_stop_times': 'loader',
+    'load_graph': 'loader',
+    'save_graph': 'loader',
+    'load_stop_times_parallel': 'gtfs_ingest',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
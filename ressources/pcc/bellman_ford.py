@@ -1,4 +1,4 @@
-def bellman_ford(graph, source):
+def bellman_ford(graph, source, counters=None):
     """
     Implements the Bellman-Ford algorithm to find shortest paths from a source vertex.
     
@@ -6,6 +6,7 @@ def bellman_ford(graph, source):
     graph (dict): A dictionary representing the graph where keys are vertices 
                   and values are lists of (destination, weight) tuples
     source (int/str): The source vertex from which to calculate shortest paths
+    counters (OperationCounters): Optional, counts the successful relaxations
     
     Returns:
     tuple: (distances, predecessors) 
@@ -26,6 +27,8 @@ def bellman_ford(graph, source):
             for v, weight in graph[u]:
                 # If we can improve the distance to v through u
                 if distances[u] + weight < distances[v]:
+                    if counters is not None:
+                        counters.relaxations += 1
                     distances[v] = distances[u] + weight
                     predecessors[v] = u
     
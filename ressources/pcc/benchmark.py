@@ -0,0 +1,176 @@
+import time
+from .dijkstra_minheap import dijkstra as dijkstra_minheap
+from .dijkstra_fibo import dijkstra_fibonacci
+from .bellman_ford import bellman_ford
+from .instrumentation import OperationCounters
+
+
+def count_reached(distances):
+    """
+    Number of nodes with a finite distance from the start node
+    """
+    return sum(1 for distance in distances.values() if distance != float('inf'))
+
+def benchmark_dijkstra(graph, start_node, count_operations=False):
+    """
+    Benchmark Dijkstra's algorithm implementations
+    
+    With count_operations, each implementation is run a second time with
+    operation counters, so the instrumentation never weighs on the timings.
+    """
+    # MinHeap implementation
+    start_time = time.time()
+    distances_minheap, _ = dijkstra_minheap(graph, start_node)
+    minheap_time = time.time() - start_time
+    
+    # Fibonacci Heap implementation
+    start_time = time.time()
+    distances_fibonacci, _ = dijkstra_fibonacci(graph, start_node)
+    fibonacci_time = time.time() - start_time
+    
+    results = {
+        'Temps Tas Binaire': minheap_time,
+        'Temps Tas Fibonacci': fibonacci_time,
+        'Distances Tas Binaire': count_reached(distances_minheap),
+        'Distances Tas Fibonacci': count_reached(distances_fibonacci),
+        'Speedup': minheap_time / fibonacci_time if fibonacci_time > 0 else 0
+    }
+    
+    if count_operations:
+        counters_minheap = OperationCounters()
+        dijkstra_minheap(graph, start_node, counters_minheap)
+        counters_fibonacci = OperationCounters()
+        dijkstra_fibonacci(graph, start_node, counters_fibonacci)
+        results['Compteurs Tas Binaire'] = counters_minheap.as_dict()
+        results['Compteurs Tas Fibonacci'] = counters_fibonacci.as_dict()
+    
+    return results
+
+def load_subgraphs(graph, sizes):
+    """
+    Create subgraphs of different sizes for benchmarking
+    """
+    subgraphs = {}
+    all_vertices = list(graph.keys())
+    
+    for size in sizes:
+        if size > len(all_vertices):
+            size = len(all_vertices)
+        
+        vertices_subset = all_vertices[:size]
+        subgraph = {v: [] for v in vertices_subset}
+        
+        # Include only edges between vertices in the subset
+        for v in vertices_subset:
+            for u, weight in graph[v]:
+                if u in vertices_subset:
+                    subgraph[v].append((u, weight))
+        
+        subgraphs[size] = subgraph
+    
+    return subgraphs
+
+def benchmark_algorithms(subgraphs, count_operations=False):
+    """
+    Benchmark all three algorithm implementations on different graph sizes
+    
+    With count_operations, each algorithm is run a second time with operation
+    counters, so the instrumentation never weighs on the timings.
+    """
+    results = {
+        'sizes': [],
+        'vertices': [],
+        'edges': [],
+        'minheap_time': [],
+        'fibonacci_time': [],
+        'bellman_ford_time': []
+    }
+    if count_operations:
+        results['minheap_counters'] = []
+        results['fibonacci_counters'] = []
+        results['bellman_ford_counters'] = []
+    
+    for size, graph in subgraphs.items():
+        # Count actual vertices and edges
+        num_vertices = len(graph)
+        num_edges = sum(len(edges) for edges in graph.values()) // 2  # Divide by 2 for undirected graph
+        
+        # Choose a start node
+        start_node = list(graph.keys())[0]
+        
+        # Benchmark MinHeap Dijkstra
+        start_time = time.time()
+        distances_minheap, _ = dijkstra_minheap(graph, start_node)
+        minheap_time = time.time() - start_time
+        
+        # Benchmark Fibonacci Heap Dijkstra
+        start_time = time.time()
+        distances_fibonacci, _ = dijkstra_fibonacci(graph, start_node)
+        fibonacci_time = time.time() - start_time
+        
+        # Benchmark Bellman-Ford
+        start_time = time.time()
+        distances_bellman, _ = bellman_ford(graph, start_node)
+        bellman_time = time.time() - start_time
+        
+        # Store results
+        results['sizes'].append(size)
+        results['vertices'].append(num_vertices)
+        results['edges'].append(num_edges)
+        results['minheap_time'].append(minheap_time)
+        results['fibonacci_time'].append(fibonacci_time)
+        results['bellman_ford_time'].append(bellman_time)
+        
+        if count_operations:
+            for key, algorithm in (('minheap_counters', dijkstra_minheap),
+                                   ('fibonacci_counters', dijkstra_fibonacci),
+                                   ('bellman_ford_counters', bellman_ford)):
+                counters = OperationCounters()
+                algorithm(graph, start_node, counters)
+                results[key].append(counters.as_dict())
+        
+        print(f"Completed benchmark for graph size {size}: {num_vertices} vertices, {num_edges} edges")
+    
+    return results
+
+def create_performance_table(results):
+    """
+    Create a comprehensive comparison table for LaTeX
+    """
+    latex_table = """
+\\begin{table}[htbp]
+\\centering
+\\caption{Comparaison des performances des algorithmes de plus court chemin}
+\\begin{tabular}{|c|c|c|c|c|c|c|}
+\\hline
+\\textbf{Taille} & \\textbf{Sommets} & \\textbf{Arêtes} & \\textbf{Dijkstra} & \\textbf{Dijkstra} & \\textbf{Bellman-} & \\textbf{Ratio} \\\\
+\\textbf{Graphe} & \\textbf{(|V|)} & \\textbf{(|E|)} & \\textbf{Binaire (s)} & \\textbf{Fibonacci (s)} & \\textbf{Ford (s)} & \\textbf{B-F/Fibo} \\\\
+\\hline
+"""
+    
+    for i in range(len(results['sizes'])):
+        size = results['sizes'][i]
+        vertices = results['vertices'][i]
+        edges = results['edges'][i]
+        minheap = results['minheap_time'][i]
+        fibonacci = results['fibonacci_time'][i]
+        bellman = results['bellman_ford_time'][i]
+        ratio = bellman / fibonacci if fibonacci > 0 else "N/A"
+        
+        if isinstance(ratio, float):
+            ratio_str = f"{ratio:.2f}"
+        else:
+            ratio_str = ratio
+            
+        row = f"{size} & {vertices} & {edges} & {minheap:.6f} & {fibonacci:.6f} & {bellman:.6f} & {ratio_str} \\\\\n\\hline\n"
+        latex_table += row
+    
+    latex_table += """\\end{tabular}
+\\label{tab:performance_comparison}
+\\end{table}
+"""
+    
+    with open('performance_table.tex', 'w') as f:
+        f.write(latex_table)
+    
+    return latex_table
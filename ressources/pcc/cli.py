@@ -0,0 +1,136 @@
+import argparse
+import sys
+
+from .loader import load_graph
+
+# Engines by CLI name: (module, function), imported only when selected
+ENGINES = {
+    'dijkstra': ('dijkstra_minheap', 'dijkstra'),
+    'fibonacci': ('dijkstra_fibo', 'dijkstra_fibonacci'),
+    'bellman-ford': ('bellman_ford', 'bellman_ford'),
+    'delta-stepping': ('delta_stepping', 'delta_stepping'),
+}
+
+
+def _engine(name):
+    from importlib import import_module
+    module, function = ENGINES[name]
+    return getattr(import_module(f".{module}", __package__), function)
+
+
+def _check_stops(graph, *stops):
+    for stop in stops:
+        if stop not in graph:
+            sys.exit(f"Erreur: arrêt {stop} absent du graphe")
+
+
+def _path_to(previous_nodes, target):
+    path = []
+    while target is not None:
+        path.append(target)
+        target = previous_nodes[target]
+    return path[::-1]
+
+
+def route(args):
+    """
+    Prints the shortest route, or several alternatives, between two stops
+    """
+    graph = load_graph(args.graph)
+    _check_stops(graph, args.source, args.target)
+
+    if args.alternatives > 1:
+        from .k_shortest import penalty_alternatives, yen_k_shortest_paths
+        search = yen_k_shortest_paths if args.method == 'yen' else penalty_alternatives
+        routes = search(graph, args.source, args.target, k=args.alternatives,
+                        max_settled=args.max_settled)
+    else:
+        distances, previous_nodes = _engine(args.algorithm)(graph, args.source)
+        routes = []
+        if distances[args.target] != float('inf'):
+            routes.append((distances[args.target], _path_to(previous_nodes, args.target)))
+
+    if not routes:
+        sys.exit(f"Aucun chemin de {args.source} à {args.target}")
+    for cost, path in routes:
+        print(f"{cost:.2f} min: {' -> '.join(path)}")
+
+
+def bench(args):
+    """
+    Times the Dijkstra implementations, optionally with operation counts
+    """
+    from .benchmark import benchmark_dijkstra
+
+    graph = load_graph(args.graph)
+    start_node = args.start if args.start is not None else next(iter(graph))
+    _check_stops(graph, start_node)
+
+    results = benchmark_dijkstra(graph, start_node, count_operations=args.counts)
+    for key, value in results.items():
+        print(f"{key}: {value}")
+
+    if args.output:
+        from .instrumentation import export_results
+        export_results(results, args.output)
+    if args.plot:
+        from .plots import plot_performance
+        plot_performance(results, args.plot)
+
+
+def build_cache(args):
+    """
+    Parses stop_times.txt once and saves the graph for the other commands
+    """
+    from .loader import load_stop_times, save_graph
+
+    if args.processes == 1:
+        graph = load_stop_times(args.stop_times)
+    else:
+        from .gtfs_ingest import load_stop_times_parallel
+        graph = load_stop_times_parallel(args.stop_times, args.processes)
+
+    save_graph(graph, args.output)
+    print(f"Graphe sauvegardé dans {args.output}: {len(graph)} nœuds, "
+          f"{sum(len(edges) for edges in graph.values())} arêtes")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='pcc', description='Shortest paths on GTFS networks')
+    commands = parser.add_subparsers(dest='command', required=True)
+    graph_help = 'stop_times.txt file or graph saved by build-cache'
+
+    parser_route = commands.add_parser('route', help='shortest route between two stops')
+    parser_route.add_argument('graph', help=graph_help)
+    parser_route.add_argument('source', help='departure stop_id')
+    parser_route.add_argument('target', help='arrival stop_id')
+    parser_route.add_argument('--algorithm', choices=ENGINES, default='dijkstra')
+    parser_route.add_argument('-k', '--alternatives', type=int, default=1,
+                              help='number of routes to return')
+    parser_route.add_argument('--method', choices=('yen', 'penalty'), default='yen',
+                              help='alternative routes algorithm')
+    parser_route.add_argument('--max-settled', type=int, default=None,
+                              help='work limit of the alternative routes search')
+    parser_route.set_defaults(func=route)
+
+    parser_bench = commands.add_parser('bench', help='benchmark the Dijkstra implementations')
+    parser_bench.add_argument('graph', help=graph_help)
+    parser_bench.add_argument('--start', help='start stop_id, the first stop by default')
+    parser_bench.add_argument('--counts', action='store_true', help='count heap operations')
+    parser_bench.add_argument('--output', help='JSON file for the results')
+    parser_bench.add_argument('--plot', help='PNG file for the comparison chart')
+    parser_bench.set_defaults(func=bench)
+
+    parser_cache = commands.add_parser('build-cache', help='parse stop_times.txt and save the graph')
+    parser_cache.add_argument('stop_times', help='stop_times.txt file')
+    parser_cache.add_argument('output', help='graph file to write')
+    parser_cache.add_argument('--processes', type=int, default=None,
+                              help='parsing processes, all cores by default; 1 parses sequentially')
+    parser_cache.set_defaults(func=build_cache)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
@@ -0,0 +1,356 @@
+import os
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+
+class CSRGraph:
+    """
+    Graph in compressed sparse row form, built once and shared by queries.
+
+    Attributes:
+    nodes (list): vertices, the position of a vertex is its index
+    indptr (ndarray): the edges of vertex i are indptr[i]:indptr[i + 1]
+    indices (ndarray): destination index of each edge
+    weights (ndarray): weight of each edge
+    """
+    def __init__(self, nodes, indptr, indices, weights):
+        self.nodes = nodes
+        self.index = {node: i for i, node in enumerate(nodes)}
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+
+    @classmethod
+    def from_edges(cls, nodes, sources, targets, weights):
+        """
+        Builds the CSR arrays with NumPy from edge arrays, such as those
+        returned by gtfs_ingest.load_edge_arrays (already sorted by source).
+
+        Args:
+        nodes (list): vertex of each index
+        sources, targets: vertex indices of each directed edge
+        weights: weight of each edge
+        """
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        weights = np.asarray(weights, dtype=np.float64)
+        if sources.size > 1 and (np.diff(sources) < 0).any():
+            order = np.argsort(sources, kind='stable')
+            sources, targets, weights = sources[order], targets[order], weights[order]
+
+        indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=len(nodes)), out=indptr[1:])
+        return cls(list(nodes), indptr, targets, weights)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Converts an adjacency-list graph (keys are vertices, values are lists
+        of (destination, weight) tuples)
+        """
+        nodes = list(graph)
+        index = {node: i for i, node in enumerate(nodes)}
+        for edges in graph.values():
+            for neighbor, _ in edges:
+                if neighbor not in index:
+                    index[neighbor] = len(nodes)
+                    nodes.append(neighbor)
+
+        degrees = np.fromiter((len(edges) for edges in graph.values()), dtype=np.int64,
+                              count=len(graph))
+        total = int(degrees.sum())
+        sources = np.repeat(np.arange(len(graph), dtype=np.int64), degrees)
+        targets = np.fromiter((index[neighbor] for edges in graph.values() for neighbor, _ in edges),
+                              dtype=np.int64, count=total)
+        weights = np.fromiter((weight for edges in graph.values() for _, weight in edges),
+                              dtype=np.float64, count=total)
+        return cls.from_edges(nodes, sources, targets, weights)
+
+
+def tune_delta(indptr, weights):
+    """
+    Chooses the bucket width from the edge-weight distribution.
+
+    Meyer and Sanders take delta of the order of max_weight / average_degree:
+    a smaller delta means more buckets and phases, a larger one means more
+    edges relaxed again inside a bucket. The median weight is used as a floor
+    so that the short hops between consecutive stops of a trip, which make
+    most of a GTFS graph, stay light edges and each bucket carries enough
+    vertices to make the vectorized relaxations worthwhile.
+    """
+    positive = weights[weights > 0]
+    if positive.size == 0:
+        return 1.0
+
+    average_degree = max(weights.size / max(indptr.size - 1, 1), 1.0)
+    return float(max(np.median(positive), positive.max() / average_degree))
+
+
+def _split_csr(indptr, indices, weights, mask):
+    """
+    Keeps the edges selected by mask, as a new CSR structure
+    """
+    sources = np.repeat(np.arange(indptr.size - 1), np.diff(indptr))
+    counts = np.bincount(sources[mask], minlength=indptr.size - 1)
+    sub_indptr = np.zeros(indptr.size, dtype=np.int64)
+    np.cumsum(counts, out=sub_indptr[1:])
+    return sub_indptr, indices[mask], weights[mask]
+
+
+def _expand(frontier, indptr, indices, weights, distances):
+    """
+    Relaxation requests of every edge leaving the frontier vertices.
+
+    Returns:
+    tuple: (sources, targets, candidates) of the requests that improve on the
+           current distance of their target
+    """
+    starts = indptr[frontier]
+    counts = indptr[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0, dtype=np.float64)
+
+    sources = np.repeat(frontier, counts)
+    edge_ids = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(total)
+    targets = indices[edge_ids]
+    candidates = distances[sources] + weights[edge_ids]
+
+    improving = candidates < distances[targets]
+    return sources[improving], targets[improving], candidates[improving]
+
+
+def _relax(requests, distances, previous, active):
+    """
+    Applies relaxation requests, keeping the smallest candidate per target
+    """
+    sources, targets, candidates = requests
+    if targets.size == 0:
+        return
+
+    order = np.lexsort((candidates, targets))
+    targets, first = np.unique(targets[order], return_index=True)
+    sources = sources[order][first]
+    candidates = candidates[order][first]
+
+    improving = candidates < distances[targets]
+    targets = targets[improving]
+    distances[targets] = candidates[improving]
+    previous[targets] = sources[improving]
+    active[targets] = True
+
+
+# Arrays shared with the worker processes, attached once by _init_worker
+_shared = {}
+
+
+def _init_worker(layouts):
+    for name, (shm_name, shape, dtype) in layouts.items():
+        shm = shared_memory.SharedMemory(name=shm_name)
+        _shared[name] = (shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+
+
+def _expand_worker(task):
+    frontier, kind = task
+    return _expand(frontier,
+                   _shared[kind + '_indptr'][1],
+                   _shared[kind + '_indices'][1],
+                   _shared[kind + '_weights'][1],
+                   _shared['distances'][1])
+
+
+class _NumpyBackend:
+    """
+    Expands the light and heavy phases in this process
+    """
+    def __init__(self, arrays):
+        self.views = arrays
+
+    def expand(self, frontier, kind):
+        return _expand(frontier, self.views[kind + '_indptr'], self.views[kind + '_indices'],
+                       self.views[kind + '_weights'], self.views['distances'])
+
+    def close(self):
+        pass
+
+
+class _ProcessBackend:
+    """
+    Expands the light and heavy phases in a pool of processes.
+
+    The CSR arrays and the distances live in shared memory and the pool is
+    kept for the lifetime of the engine: the workers read the distances
+    written by the main process, which alone applies the relaxation requests
+    they send back.
+    """
+    def __init__(self, arrays, processes, min_edges):
+        self.processes = processes
+        self.min_edges = min_edges
+        self.blocks = []
+        self.views = {}
+        layouts = {}
+        for name, array in arrays.items():
+            shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+            view[:] = array
+            self.blocks.append(shm)
+            self.views[name] = view
+            layouts[name] = (shm.name, array.shape, array.dtype.str)
+        self.pool = Pool(processes, initializer=_init_worker, initargs=(layouts,))
+
+    def expand(self, frontier, kind):
+        indptr = self.views[kind + '_indptr']
+        degrees = indptr[frontier + 1] - indptr[frontier]
+        total = int(degrees.sum())
+        if total < self.min_edges:
+            return _expand(frontier, indptr, self.views[kind + '_indices'],
+                           self.views[kind + '_weights'], self.views['distances'])
+
+        # Cut the frontier into chunks carrying about the same number of edges
+        bounds = np.searchsorted(np.cumsum(degrees),
+                                 np.linspace(0, total, self.processes + 1)[1:-1])
+        chunks = [chunk for chunk in np.split(frontier, bounds) if chunk.size]
+        results = self.pool.map(_expand_worker, [(chunk, kind) for chunk in chunks])
+        return tuple(np.concatenate(parts) for parts in zip(*results))
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+        self.views.clear()
+        for shm in self.blocks:
+            shm.close()
+            shm.unlink()
+
+
+class DeltaStepping:
+    """
+    Delta-stepping engine answering single-source shortest path queries.
+
+    Vertices are grouped in buckets of width delta. The vertices of the
+    current bucket are relaxed together along their light edges (weight <=
+    delta) until the bucket stays empty, then once along their heavy edges.
+    Each of these phases is a batch of NumPy operations over all the edges
+    leaving the bucket.
+
+    The CSR arrays, their light/heavy split and, with the 'processes'
+    backend, the shared memory and the worker pool are set up once here and
+    reused by every query. Queries must not run concurrently on one engine.
+    Call close() (or use the engine as a context manager) to stop the pool.
+
+    Args:
+    graph (CSRGraph or dict): the graph, converted once when given as an
+                              adjacency-list dictionary; weights must be
+                              non-negative
+    delta (float): bucket width, tuned from the edge weights when None
+    backend (str): 'numpy' runs the phases in this process, 'processes'
+                   splits the large ones between worker processes
+    processes (int): number of workers, defaults to the number of cores
+    min_parallel_edges (int): phases relaxing fewer edges than this stay in
+                              the main process with the 'processes' backend
+    """
+    def __init__(self, graph, delta=None, backend='numpy', processes=None,
+                 min_parallel_edges=10000):
+        if backend not in ('numpy', 'processes'):
+            raise ValueError(f"Unknown backend: {backend}")
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_graph(graph)
+        if graph.weights.size and graph.weights.min() < 0:
+            raise ValueError("Delta-stepping requires non-negative weights")
+        if delta is None:
+            delta = tune_delta(graph.indptr, graph.weights)
+        elif not delta > 0:
+            raise ValueError(f"delta must be positive, got {delta}")
+
+        self.graph = graph
+        self.delta = delta
+
+        light = graph.weights <= delta
+        arrays = {}
+        arrays['light_indptr'], arrays['light_indices'], arrays['light_weights'] = \
+            _split_csr(graph.indptr, graph.indices, graph.weights, light)
+        arrays['heavy_indptr'], arrays['heavy_indices'], arrays['heavy_weights'] = \
+            _split_csr(graph.indptr, graph.indices, graph.weights, ~light)
+        arrays['distances'] = np.full(len(graph.nodes), np.inf)
+
+        if backend == 'processes':
+            self.backend = _ProcessBackend(arrays, processes or os.cpu_count() or 1,
+                                           min_parallel_edges)
+        else:
+            self.backend = _NumpyBackend(arrays)
+
+    def shortest_path_arrays(self, start):
+        """
+        Runs one query from the start vertex.
+
+        Returns:
+        tuple: (distances, previous) arrays indexed like graph.nodes, with -1
+               as the previous index of the start and unreached vertices
+        """
+        delta = self.delta
+        expand = self.backend.expand
+        distances = self.backend.views['distances']
+        distances.fill(np.inf)
+
+        size = len(self.graph.nodes)
+        previous = np.full(size, -1, dtype=np.int64)
+        # Vertices whose distance changed since they were last relaxed
+        active = np.zeros(size, dtype=bool)
+        source = self.graph.index[start]
+        distances[source] = 0
+        active[source] = True
+
+        while active.any():
+            current = np.floor(distances[active].min() / delta)
+            settled = np.zeros(size, dtype=bool)
+
+            # Light phases until the current bucket stays empty
+            while True:
+                frontier = np.flatnonzero(active & (np.floor(distances / delta) == current))
+                if frontier.size == 0:
+                    break
+                active[frontier] = False
+                settled[frontier] = True
+                _relax(expand(frontier, 'light'), distances, previous, active)
+
+            # Heavy edges always lead to a later bucket: relaxed once
+            _relax(expand(np.flatnonzero(settled), 'heavy'), distances, previous, active)
+
+        return distances.copy(), previous
+
+    def shortest_paths(self, start):
+        """
+        Runs one query from the start vertex.
+
+        Returns:
+        tuple: (distances, previous_nodes) dictionaries, as for dijkstra
+        """
+        distances, previous = self.shortest_path_arrays(start)
+        nodes = self.graph.nodes
+        return (dict(zip(nodes, distances.tolist())),
+                {node: nodes[p] if p >= 0 else None for node, p in zip(nodes, previous.tolist())})
+
+    def close(self):
+        self.backend.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def delta_stepping(graph, start, delta=None, backend='numpy', processes=None,
+                   min_parallel_edges=10000):
+    """
+    Single-source shortest paths with the delta-stepping algorithm.
+
+    Sets up a DeltaStepping engine for a single query; build the engine
+    (and a CSRGraph) once instead when answering several queries.
+
+    Returns:
+    tuple: (distances, previous_nodes) dictionaries, as for dijkstra
+    """
+    with DeltaStepping(graph, delta, backend, processes, min_parallel_edges) as engine:
+        return engine.shortest_paths(start)
@@ -169,15 +169,41 @@ class FibonacciHeap:
         return self.min_node is None
     
     
+class CountingFibonacciHeap(FibonacciHeap):
+    """
+    FibonacciHeap recording its operations in an OperationCounters
+    """
+    def __init__(self, counters):
+        super().__init__()
+        self.counters = counters
     
-def dijkstra_fibonacci(graph, start):
+    def insert(self, key, value):
+        self.counters.pushes += 1
+        return super().insert(key, value)
+    
+    def extract_min(self):
+        self.counters.pops += 1
+        return super().extract_min()
+    
+    def decrease_key(self, value, new_key):
+        decreased = super().decrease_key(value, new_key)
+        if decreased:
+            self.counters.decrease_keys += 1
+        return decreased
+    
+    def _link(self, child, parent):
+        self.counters.links += 1
+        super()._link(child, parent)
+    
+    
+def dijkstra_fibonacci(graph, start, counters=None):
     # Initialisation
     distances = {node: float('inf') for node in graph}
     distances[start] = 0
     previous_nodes = {node: None for node in graph}
     
-    # File de priorité (notre tas de Fibonacci)
-    heap = FibonacciHeap()
+    # File de priorité (notre tas de Fibonacci), instrumentée si des compteurs sont fournis
+    heap = FibonacciHeap() if counters is None else CountingFibonacciHeap(counters)
     heap.insert(0, start)
     
     # Pour garder une référence aux noeuds dans le tas
@@ -189,13 +215,19 @@ def dijkstra_fibonacci(graph, start):
         
         # Si on a déjà trouvé un meilleur chemin, on ignore
         if current_dist > distances[current_node]:
+            if counters is not None:
+                counters.stale_pops += 1
             continue
+        if counters is not None:
+            counters.settled += 1
             
         for neighbor, weight in graph[current_node]:
             distance = current_dist + weight
             
             # Si on trouve un chemin plus court
             if distance < distances[neighbor]:
+                if counters is not None:
+                    counters.relaxations += 1
                 distances[neighbor] = distance
                 previous_nodes[neighbor] = current_node
                 
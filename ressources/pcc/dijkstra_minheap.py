@@ -60,38 +60,56 @@ class MinHeap:
     def __len__(self):
         return len(self.heap)
 
-def dijkstra(graph, start):
+class CountingMinHeap(MinHeap):
+    """
+    MinHeap recording its pushes and pops in an OperationCounters
+    """
+    def __init__(self, counters):
+        super().__init__()
+        self.counters = counters
+
+    def push(self, item):
+        self.counters.pushes += 1
+        super().push(item)
+
+    def pop(self):
+        self.counters.pops += 1
+        return super().pop()
+
+def dijkstra(graph, start, counters=None):
     # Initialization
     distances = {node: float('inf') for node in graph}
     distances[start] = 0 
     previous_nodes = {node: None for node in graph}
     
-    # Priority queue using MinHeap
-    heap = MinHeap()
+    # Priority queue using MinHeap, instrumented only when counters are given
+    heap = MinHeap() if counters is None else CountingMinHeap(counters)
     heap.push((0, start)) 
     
-    # To solve the problem of duplicates in the heap
-    in_heap = {start}
-    
     while len(heap) > 0:
         curr_dist, curr_node = heap.pop()
-        in_heap.remove(curr_node)
         
-        # If a better path is found, continue
+        # Stale entry: the node was pushed again with a shorter distance
         if curr_dist > distances[curr_node]:
+            if counters is not None:
+                counters.stale_pops += 1
             continue
+        if counters is not None:
+            counters.settled += 1
         
         for neighbor, weight in graph[curr_node]:
             distance = curr_dist + weight 
             
             # If a shorter path is found
             if distance < distances[neighbor]:
+                if counters is not None:
+                    counters.relaxations += 1
+                    # A binary heap has no decrease-key: the node is pushed
+                    # again and its old entry becomes stale
+                    if distances[neighbor] != float('inf'):
+                        counters.decrease_keys += 1
                 distances[neighbor] = distance 
                 previous_nodes[neighbor] = curr_node 
-                
-                # Add only if not already in the heap
-                if neighbor not in in_heap:
-                    heap.push((distance, neighbor))
-                    in_heap.add(neighbor)
+                heap.push((distance, neighbor))
     
-    return distances, previous_nodes
\ No newline at end of file
+    return distances, previous_nodes
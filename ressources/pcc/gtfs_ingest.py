@@ -0,0 +1,250 @@
+import csv
+import os
+from multiprocessing import Pool
+
+import numpy as np
+
+
+def _chunk_bounds(file_path, chunks):
+    """
+    Splits stop_times.txt into byte ranges that start and end on line
+    boundaries, after the header line.
+
+    Returns:
+    tuple: (header, bounds) where header is the list of column names and
+           bounds a list of (start, end) byte offsets
+    """
+    with open(file_path, 'rb') as f:
+        header_line = f.readline()
+        data_start = f.tell()
+        size = f.seek(0, os.SEEK_END)
+
+        offsets = [data_start]
+        for i in range(1, chunks):
+            f.seek(max(data_start + (size - data_start) * i // chunks - 1, data_start))
+            f.readline()
+            offset = f.tell()
+            if offsets[-1] < offset < size:
+                offsets.append(offset)
+        offsets.append(size)
+
+    header = next(csv.reader([header_line.decode('utf-8-sig')]))
+    return header, list(zip(offsets, offsets[1:]))
+
+
+def _link_trips(trips, stops, seconds):
+    """
+    Links consecutive stops of each trip, ordered by arrival time (the sort
+    is stable, so equal times keep the file order).
+
+    Returns:
+    tuple: (first, second, weights) with weights in minutes
+    """
+    if trips.size == 0:
+        return trips, stops, np.empty(0, dtype=np.float64)
+
+    # One integer key per row: a stable radix sort instead of a lexsort
+    order = np.argsort(trips * (int(seconds.max()) + 1) + seconds, kind='stable')
+    trips, stops, seconds = trips[order], stops[order], seconds[order]
+
+    same_trip = trips[1:] == trips[:-1]
+    return (stops[:-1][same_trip], stops[1:][same_trip],
+            (seconds[1:] - seconds[:-1])[same_trip] / 60)
+
+
+def _min_edges(first, second, weights, size):
+    """
+    Reduces undirected edges to one (smaller code, larger code) pair each,
+    keeping the minimum weight; size is the number of stop codes
+    """
+    if first.size == 0:
+        return first, second, weights
+
+    keys = np.minimum(first, second) * size + np.maximum(first, second)
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    weights = np.minimum.reduceat(weights[order], starts)
+    keys = keys[starts]
+    return keys // size, keys % size, weights
+
+
+def _parse_chunk(task):
+    """
+    Parses one byte range of stop_times.txt and links the trips it holds
+    whole.
+
+    Trip and stop identifiers are coded locally to the chunk, in order of
+    first appearance; the main process maps them to global codes. A trip is
+    linked here when its rows form a single run that neither starts nor ends
+    the chunk (unless the chunk starts or ends the file). The rows of the
+    other trips, which may continue in another chunk, are returned as they
+    are.
+
+    Returns:
+    tuple: (trip_ids, stop_ids, linked, edges, open_rows)
+           - trip_ids, stop_ids: identifiers of the local codes
+           - linked: boolean array, True for the trips linked in the chunk
+           - edges: (first, second, weights) of the linked trips, reduced to
+             the minimum weight per undirected edge
+           - open_rows: (trips, stops, seconds) of the other trips, arrival
+             times in seconds after midnight
+    """
+    file_path, start, end, columns, first_chunk, last_chunk, link = task
+    trip_column, stop_column, time_column = columns
+
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode('utf-8')
+
+    trip_codes = {}
+    stop_codes = {}
+    trips = []
+    stops = []
+    seconds = []
+    for row in csv.reader(text.splitlines()):
+        if not row:
+            continue
+        trips.append(trip_codes.setdefault(row[trip_column], len(trip_codes)))
+        stops.append(stop_codes.setdefault(row[stop_column], len(stop_codes)))
+        h, m, s = map(int, row[time_column].split(':'))
+        seconds.append(h * 3600 + m * 60 + s)
+
+    trips = np.array(trips, dtype=np.int64)
+    stops = np.array(stops, dtype=np.int64)
+    seconds = np.array(seconds, dtype=np.int64)
+
+    linked = np.zeros(len(trip_codes), dtype=bool)
+    if link and trips.size:
+        run_starts = np.flatnonzero(np.r_[True, trips[1:] != trips[:-1]])
+        run_trips = trips[run_starts]
+        linked = np.bincount(run_trips, minlength=len(trip_codes)) == 1
+        if not first_chunk:
+            linked[run_trips[0]] = False
+        if not last_chunk:
+            linked[run_trips[-1]] = False
+
+    closed = linked[trips]
+    edges = _min_edges(*_link_trips(trips[closed], stops[closed], seconds[closed]), len(stop_codes))
+    open_rows = (trips[~closed], stops[~closed], seconds[~closed])
+    return list(trip_codes), list(stop_codes), linked, edges, open_rows
+
+
+def _global_codes(local_ids, codes):
+    """
+    Maps local identifiers to global codes, allocating new codes as needed
+    """
+    return np.array([codes.setdefault(identifier, len(codes)) for identifier in local_ids],
+                    dtype=np.int64)
+
+
+def _linked_elsewhere(parsed):
+    """
+    Whether a trip linked by one chunk also has rows in another chunk, which
+    only happens when the rows of stop_times.txt are not grouped by trip
+    """
+    chunks_per_trip = {}
+    for trip_ids, _, _, _, _ in parsed:
+        for trip_id in trip_ids:
+            chunks_per_trip[trip_id] = chunks_per_trip.get(trip_id, 0) + 1
+
+    return any(chunks_per_trip[trip_id] > 1
+               for trip_ids, _, linked, _, _ in parsed
+               for trip_id in np.array(trip_ids, dtype=object)[linked])
+
+
+def load_edge_arrays(file_path, processes=None, chunk_size=16 * 1024 * 1024):
+    """
+    Loads stop_times.txt in parallel as integer-coded edge arrays.
+
+    The file is cut at line boundaries into chunks of about chunk_size bytes,
+    which a pool of processes parses into integer-coded rows. Each worker
+    links the trips lying entirely inside its chunk and reduces their edges;
+    only the rows of trips crossing a chunk boundary go back to the main
+    process, which links them and merges the edges of all chunks. If the
+    rows are not grouped by trip, so that a trip linked by one chunk also
+    appears in another, the chunks are parsed again without linking and all
+    the trips are linked by the main process. As in loader.load_stop_times,
+    edges are undirected, weighted in minutes, and only the minimum weight
+    of duplicate edges is kept.
+
+    Args:
+    file_path (str): path of stop_times.txt
+    processes (int): number of workers, defaults to the number of cores
+    chunk_size (int): approximate size in bytes of the parsed chunks
+
+    Returns:
+    tuple: (stop_ids, sources, targets, weights)
+           - stop_ids: stop identifier of each code
+           - sources, targets: stop codes of each directed edge, sorted
+           - weights: weight of each edge in minutes
+    """
+    processes = processes or os.cpu_count() or 1
+    # At least one chunk per worker, so that every core is used
+    chunks = max(os.path.getsize(file_path) // chunk_size, processes, 1)
+
+    header, bounds = _chunk_bounds(file_path, chunks)
+    columns = (header.index('trip_id'), header.index('stop_id'), header.index('arrival_time'))
+
+    def tasks(link):
+        return [(file_path, start, end, columns, i == 0, i == len(bounds) - 1, link)
+                for i, (start, end) in enumerate(bounds)]
+
+    if processes > 1 and len(bounds) > 1:
+        with Pool(min(processes, len(bounds))) as pool:
+            parsed = pool.map(_parse_chunk, tasks(True))
+            if _linked_elsewhere(parsed):
+                parsed = pool.map(_parse_chunk, tasks(False))
+    else:
+        parsed = [_parse_chunk(task) for task in tasks(True)]
+        if _linked_elsewhere(parsed):
+            parsed = [_parse_chunk(task) for task in tasks(False)]
+
+    # Global codes, in order of first appearance in the file
+    trip_codes = {}
+    stop_codes = {}
+    empty = np.empty(0, dtype=np.int64)
+    edges = [(empty, empty, np.empty(0, dtype=np.float64))]
+    open_rows = [(empty, empty, empty)]
+    for trip_ids, stop_ids, _, (first, second, weights), (trips, stops, seconds) in parsed:
+        stop_map = _global_codes(stop_ids, stop_codes)
+        edges.append((stop_map[first], stop_map[second], weights))
+        if trips.size:
+            # Only the trips left open need a global code
+            open_trips = np.unique(trips)
+            trip_map = np.zeros(len(trip_ids), dtype=np.int64)
+            trip_map[open_trips] = _global_codes([trip_ids[i] for i in open_trips.tolist()],
+                                                 trip_codes)
+            open_rows.append((trip_map[trips], stop_map[stops], seconds))
+
+    # Trips crossing chunk boundaries, then the edges of every chunk
+    edges.append(_link_trips(*(np.concatenate(parts) for parts in zip(*open_rows))))
+    low, high, weights = _min_edges(*(np.concatenate(parts) for parts in zip(*edges)),
+                                    len(stop_codes))
+
+    # Undirected graph: both directions of each edge (a loop is kept once)
+    loop = low == high
+    sources = np.concatenate((low, high[~loop]))
+    targets = np.concatenate((high, low[~loop]))
+    weights = np.concatenate((weights, weights[~loop]))
+
+    order = np.argsort(sources * max(len(stop_codes), 1) + targets, kind='stable')
+    return list(stop_codes), sources[order], targets[order], weights[order]
+
+
+def load_stop_times_parallel(file_path, processes=None, chunk_size=16 * 1024 * 1024):
+    """
+    Parallel counterpart of loader.load_stop_times, building the same
+    graph (keys are stops, values are lists of (neighbor, weight) tuples)
+    """
+    stop_ids, sources, targets, weights = load_edge_arrays(file_path, processes, chunk_size)
+
+    # Edges are sorted by source: slice one list of (neighbor, weight) tuples
+    edges = list(zip([stop_ids[target] for target in targets.tolist()], weights.tolist()))
+    starts = np.flatnonzero(np.r_[True, sources[1:] != sources[:-1]]) if sources.size else sources
+    ends = np.r_[starts[1:], sources.size]
+    graph = {stop_ids[source]: edges[start:end]
+             for source, start, end in zip(sources[starts].tolist(), starts.tolist(), ends.tolist())}
+
+    # Stops in order of first appearance in the file
+    return {stop: graph[stop] for stop in stop_ids if stop in graph}
@@ -0,0 +1,46 @@
+import json
+
+
+class OperationCounters:
+    """
+    Operation counts of one shortest path computation.
+
+    Engines and heaps only touch a counters object when one is passed to
+    them, so a run without counters pays nothing for the instrumentation.
+    """
+    FIELDS = ('pushes', 'pops', 'decrease_keys', 'stale_pops',
+              'relaxations', 'links', 'settled')
+    __slots__ = FIELDS
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """
+        Sets every counter back to zero
+        """
+        for field in self.FIELDS:
+            setattr(self, field, 0)
+
+    def as_dict(self):
+        """
+        Returns the counters as a plain dictionary
+        """
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __repr__(self):
+        counts = ', '.join(f"{field}={getattr(self, field)}" for field in self.FIELDS)
+        return f"OperationCounters({counts})"
+
+
+def export_results(results, file_path):
+    """
+    Writes benchmark results (timings and operation counts) to a JSON file
+    """
+    def convert(value):
+        if isinstance(value, OperationCounters):
+            return value.as_dict()
+        raise TypeError(f"Cannot export {type(value).__name__}")
+
+    with open(file_path, 'w') as f:
+        json.dump(results, f, indent=2, default=convert)
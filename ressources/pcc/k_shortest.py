@@ -0,0 +1,306 @@
+from .dijkstra_minheap import MinHeap
+
+
+def _reverse_tree(graph, target, source):
+    """
+    Shortest-path tree towards target, computed on the reversed graph.
+
+    The search stops as soon as source is settled. Every vertex left
+    unsettled is at least radius away from target, so
+    min(distance, radius) stays an admissible and consistent A* potential.
+
+    Returns:
+    tuple: (distances, successors, radius, settled_count)
+           - distances: exact distance to target of the settled vertices
+           - successors: next vertex on the shortest path towards target,
+             exact for the settled vertices
+           - radius: distance of source to target, or infinity when the whole
+             reverse graph was explored without reaching source
+           - settled_count: number of vertices settled by the search
+    """
+    reverse = {node: [] for node in graph}
+    for u in graph:
+        for v, weight in graph[u]:
+            reverse.setdefault(v, []).append((u, weight))
+
+    tentative = {target: 0}
+    successors = {target: None}
+    distances = {}
+
+    heap = MinHeap()
+    heap.push((0, target))
+
+    while len(heap) > 0:
+        curr_dist, curr_node = heap.pop()
+        if curr_node in distances:
+            continue
+        distances[curr_node] = curr_dist
+        if curr_node == source:
+            return distances, successors, curr_dist, len(distances)
+
+        for neighbor, weight in reverse.get(curr_node, ()):
+            distance = curr_dist + weight
+            if distance < tentative.get(neighbor, float('inf')):
+                tentative[neighbor] = distance
+                successors[neighbor] = curr_node
+                heap.push((distance, neighbor))
+
+    return distances, successors, float('inf'), len(distances)
+
+
+def _tree_path(node, successors):
+    """
+    Follows the reverse tree from node up to the target
+    """
+    path = [node]
+    while successors[node] is not None:
+        node = successors[node]
+        path.append(node)
+    return path
+
+
+def _search(graph, source, target, potential, radius, banned_nodes=(), banned_edges=(),
+            penalties=None, budget=None):
+    """
+    A* search from source to target guided by the reverse-tree distances.
+
+    Removing vertices or edges and multiplying weights by penalties >= 1 can
+    only lengthen paths, so the distances of the unmodified graph stay an
+    admissible and consistent potential for every search of a query.
+
+    Args:
+    potential (dict): distance to target in the full graph of the vertices
+                      settled by the reverse tree
+    radius (float): potential of the other vertices
+    banned_nodes (set): vertices the path may not go through
+    banned_edges (set): (u, v) edges the path may not use
+    penalties (dict): optional (u, v) -> multiplicative weight factor
+    budget (int): maximum number of vertices to settle, None for no limit
+
+    Returns:
+    tuple: (path, costs, settled_count, exhausted)
+           - path: list of vertices, None if target is unreachable or the
+             budget ran out
+           - costs: unpenalized cumulative cost at each vertex of path
+           - settled_count: number of vertices settled by the search
+           - exhausted: True when the search stopped on the budget
+    """
+    inf = float('inf')
+    if potential.get(source, radius) == inf:
+        return None, None, 0, False
+
+    scores = {source: 0}
+    costs = {source: 0}
+    previous_nodes = {source: None}
+    settled = set()
+
+    heap = MinHeap()
+    heap.push((potential.get(source, radius), source))
+
+    while len(heap) > 0:
+        _, curr_node = heap.pop()
+        if curr_node in settled:
+            continue
+        if budget is not None and len(settled) >= budget:
+            return None, None, len(settled), True
+        settled.add(curr_node)
+
+        if curr_node == target:
+            path = []
+            node = target
+            while node is not None:
+                path.append(node)
+                node = previous_nodes[node]
+            path.reverse()
+            return path, [costs[node] for node in path], len(settled), False
+
+        curr_score = scores[curr_node]
+        for neighbor, weight in graph[curr_node]:
+            if neighbor in settled or neighbor in banned_nodes:
+                continue
+            if (curr_node, neighbor) in banned_edges:
+                continue
+            h = potential.get(neighbor, radius)
+            if h == inf:
+                continue
+
+            score = curr_score + weight
+            if penalties is not None:
+                score = curr_score + weight * penalties.get((curr_node, neighbor), 1)
+
+            if score < scores.get(neighbor, inf):
+                scores[neighbor] = score
+                costs[neighbor] = costs[curr_node] + weight
+                previous_nodes[neighbor] = curr_node
+                heap.push((score + h, neighbor))
+
+    return None, None, len(settled), False
+
+
+def yen_k_shortest_paths(graph, source, target, k=3, max_settled=None):
+    """
+    Computes the k shortest loopless paths with Yen's algorithm.
+
+    The reverse shortest-path tree towards target is computed once, up to
+    source, and shared by every spur search: it serves as the A* potential,
+    and a spur vertex settled by the tree whose tree path avoids the removed
+    vertices and edges gets its spur path straight from the tree without any
+    search. Following Lawler, spur vertices are only taken from the deviation
+    point of each path onwards.
+
+    Args:
+    graph (dict): keys are vertices, values are lists of (destination, weight)
+    source: the departure vertex
+    target: the arrival vertex
+    k (int): number of paths wanted
+    max_settled (int): maximum number of vertices settled by the query, the
+                       reverse tree included, None for no limit. Once it is
+                       spent, the paths found so far are returned.
+
+    Returns:
+    list: up to k (cost, path) tuples sorted by increasing cost
+    """
+    if source == target:
+        return [(0, [source])]
+
+    potential, successors, radius, settled = _reverse_tree(graph, target, source)
+    if source not in potential:
+        return []
+    budget = None if max_settled is None else max_settled - settled
+
+    first_path = _tree_path(source, successors)
+    first_costs = [potential[source] - potential[node] for node in first_path]
+    found = [(potential[source], first_path, first_costs, 0)]
+    seen = {tuple(first_path)}
+    candidates = MinHeap()
+
+    while len(found) < k:
+        _, prev_path, prev_costs, deviation = found[-1]
+
+        # The best candidate is the next shortest path only once every spur
+        # vertex of the previous path has been searched
+        complete = True
+        for i in range(deviation, len(prev_path) - 1):
+            if budget is not None and budget <= 0:
+                complete = False
+                break
+            spur_node = prev_path[i]
+            root_path = prev_path[:i + 1]
+            banned_nodes = set(root_path[:-1])
+            banned_edges = {(spur_node, path[i + 1]) for _, path, _, _ in found
+                            if len(path) > i + 1 and path[:i + 1] == root_path}
+
+            # Reuse the reverse tree when its path is still allowed
+            spur_path = _tree_path(spur_node, successors) if spur_node in potential else None
+            if (spur_path is not None and (spur_node, spur_path[1]) not in banned_edges
+                    and banned_nodes.isdisjoint(spur_path)):
+                spur_costs = [potential[spur_node] - potential[node] for node in spur_path]
+            else:
+                spur_path, spur_costs, settled, exhausted = _search(
+                    graph, spur_node, target, potential, radius,
+                    banned_nodes, banned_edges, budget=budget)
+                if budget is not None:
+                    budget -= settled
+                if exhausted:
+                    complete = False
+                    break
+                if spur_path is None:
+                    continue
+
+            path = root_path + spur_path[1:]
+            if tuple(path) in seen:
+                continue
+            seen.add(tuple(path))
+
+            costs = prev_costs[:i + 1] + [prev_costs[i] + cost for cost in spur_costs[1:]]
+            candidates.push((costs[-1], path, costs, i))
+
+        if not complete or len(candidates) == 0:
+            break
+        found.append(candidates.pop())
+
+    return [(cost, path) for cost, path, _, _ in found]
+
+
+def penalty_alternatives(graph, source, target, k=3, penalty=0.4, max_stretch=1.4,
+                         max_overlap=0.7, max_iterations=None, max_settled=None):
+    """
+    Generates alternative routes with the penalty method.
+
+    Each iteration runs one A* search in which the edges of the routes already
+    found are made more expensive, so the next route is pushed away from them.
+    A route is kept when it is not much longer than the shortest one and does
+    not share too much of its length with a route already kept. This is much
+    cheaper than Yen's algorithm but gives no guarantee of optimality.
+
+    Args:
+    graph (dict): keys are vertices, values are lists of (destination, weight)
+    source: the departure vertex
+    target: the arrival vertex
+    k (int): number of routes wanted
+    penalty (float): each use of an edge multiplies its weight by 1 + penalty
+    max_stretch (float): maximum cost of a route relative to the shortest one
+    max_overlap (float): maximum share of a route's cost that may be spent on
+                         edges of the routes already kept
+    max_iterations (int): maximum number of searches, defaults to 3 * k
+    max_settled (int): maximum number of vertices settled by the query, the
+                       reverse tree included, None for no limit
+
+    Returns:
+    list: up to k (cost, path) tuples, the shortest route first
+    """
+    if source == target:
+        return [(0, [source])]
+    if max_iterations is None:
+        max_iterations = 3 * k
+
+    potential, successors, radius, settled = _reverse_tree(graph, target, source)
+    if source not in potential:
+        return []
+    budget = None if max_settled is None else max_settled - settled
+
+    shortest_path = _tree_path(source, successors)
+    shortest_cost = potential[source]
+    routes = [(shortest_cost, shortest_path)]
+    seen = {tuple(shortest_path)}
+
+    # Edges of the kept routes, in both directions
+    kept_edges = set()
+    penalties = {}
+
+    def penalize(path):
+        for u, v in zip(path, path[1:]):
+            for edge in ((u, v), (v, u)):
+                penalties[edge] = penalties.get(edge, 1) * (1 + penalty)
+
+    penalize(shortest_path)
+    for u, v in zip(shortest_path, shortest_path[1:]):
+        kept_edges.update(((u, v), (v, u)))
+
+    for _ in range(max_iterations):
+        if len(routes) >= k or (budget is not None and budget <= 0):
+            break
+
+        path, costs, settled, _ = _search(graph, source, target, potential, radius,
+                                          penalties=penalties, budget=budget)
+        if budget is not None:
+            budget -= settled
+        if path is None:
+            break
+        penalize(path)
+
+        cost = costs[-1]
+        if tuple(path) in seen or cost > max_stretch * shortest_cost:
+            continue
+        seen.add(tuple(path))
+
+        shared = sum(b - a for u, v, a, b in zip(path, path[1:], costs, costs[1:])
+                     if (u, v) in kept_edges)
+        if cost > 0 and shared / cost > max_overlap:
+            continue
+
+        routes.append((cost, path))
+        for u, v in zip(path, path[1:]):
+            kept_edges.update(((u, v), (v, u)))
+
+    return routes
@@ -0,0 +1,72 @@
+import csv
+import pickle
+
+
+def load_stop_times(file_path):
+    """
+    Load stop times and create a graph representation
+    """
+    graph = {}
+    trips = {}
+    
+    with open(file_path, 'r') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            trip_id = row['trip_id']
+            stop_id = row['stop_id']
+            arrival_time = row['arrival_time']
+            
+            # Group stops by trip
+            if trip_id not in trips:
+                trips[trip_id] = []
+            trips[trip_id].append((stop_id, arrival_time))
+    
+    # Sort stops by arrival time within each trip
+    for trip_id in trips:
+        trips[trip_id].sort(key=lambda x: x[1])
+    
+    # Create graph from trips
+    for trip_stops in trips.values():
+        for i in range(len(trip_stops) - 1):
+            current_stop, current_time = trip_stops[i]
+            next_stop, next_time = trip_stops[i+1]
+            
+            # Calculate time difference as edge weight (in minutes for simplicity)
+            h1, m1, s1 = map(int, current_time.split(':'))
+            h2, m2, s2 = map(int, next_time.split(':'))
+            weight_seconds = (h2 * 3600 + m2 * 60 + s2) - (h1 * 3600 + m1 * 60 + s1)
+            weight_minutes = weight_seconds / 60  # Convert to minutes for more readable values
+            
+            # Add to graph (undirected)
+            if current_stop not in graph:
+                graph[current_stop] = {}
+            if next_stop not in graph:
+                graph[next_stop] = {}
+            
+            # Use dictionary to avoid duplicate edges (keep minimum weight)
+            if next_stop not in graph[current_stop] or weight_minutes < graph[current_stop][next_stop]:
+                graph[current_stop][next_stop] = weight_minutes
+            if current_stop not in graph[next_stop] or weight_minutes < graph[next_stop][current_stop]:
+                graph[next_stop][current_stop] = weight_minutes
+    
+    # Convert dictionary format to list format for compatibility with Dijkstra
+    for node in graph:
+        graph[node] = [(neighbor, weight) for neighbor, weight in graph[node].items()]
+    
+    return graph
+
+def save_graph(graph, file_path):
+    """
+    Saves a loaded graph, so that later runs skip the GTFS parsing
+    """
+    with open(file_path, 'wb') as f:
+        pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+def load_graph(file_path):
+    """
+    Loads a graph saved by save_graph, or builds it from a stop_times.txt file
+    """
+    if file_path.endswith('.txt'):
+        return load_stop_times(file_path)
+    with open(file_path, 'rb') as f:
+        return pickle.load(f)
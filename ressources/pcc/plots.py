@@ -0,0 +1,101 @@
+# matplotlib and numpy are imported by the functions that use them, so that
+# importing the engines never pays for the plotting stack
+
+
+def plot_performance(results, file_path='dijkstra_performance_side.png'):
+    """
+    Alternative version showing both metrics with better spacing
+    """
+    import matplotlib.pyplot as plt
+    
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+    
+    # Time comparison
+    implementations = ['Binary Heap', 'Fibonacci Heap']
+    times = [results['Temps Tas Binaire'], results['Temps Tas Fibonacci']]
+    ax1.bar(implementations, times, color=['#3498db', '#e74c3c'])
+    ax1.set_ylabel('Execution Time (seconds)')
+    for i, v in enumerate(times):
+        ax1.text(i, v * 1.05, f"{v:.4f}s", ha='center')
+    
+    # Nodes comparison
+    nodes = [results['Distances Tas Binaire'], results['Distances Tas Fibonacci']]
+    ax2.bar(implementations, nodes, color=['#3498db', '#e74c3c'])
+    ax2.set_ylabel('Nodes Reached')
+    for i, v in enumerate(nodes):
+        ax2.text(i, v * 1.02, str(v), ha='center')
+    
+    fig.suptitle('Dijkstra Algorithm Performance Comparison')
+    plt.tight_layout()
+    plt.savefig(file_path, dpi=300)
+    plt.close()
+
+def plot_theoretical_vs_empirical(results, file_path='algorithmes_performance_comparaison.png'):
+    """
+    Plot theoretical complexity bounds versus empirical results
+    """
+    import matplotlib.pyplot as plt
+    import numpy as np
+    
+    plt.figure(figsize=(18, 12))
+    
+    # Get data
+    vertices = np.array(results['vertices'])
+    edges = np.array(results['edges'])
+    
+    # Plot 1: Dijkstra MinHeap
+    plt.subplot(2, 2, 1)
+    theoretical_minheap = edges * np.log(vertices)  # O(E log V)
+    # Normalize for comparison
+    theoretical_minheap = theoretical_minheap * (max(results['minheap_time']) / max(theoretical_minheap))
+    
+    plt.plot(results['sizes'], results['minheap_time'], 'b-', marker='o', label='Empirique')
+    plt.plot(results['sizes'], theoretical_minheap, 'b--', label='Théorique O(E log V)')
+    plt.title('Dijkstra avec Tas Binaire')
+    plt.xlabel('Taille du graphe')
+    plt.ylabel('Temps (secondes)')
+    plt.legend()
+    plt.grid(True)
+    
+    # Plot 2: Dijkstra Fibonacci Heap
+    plt.subplot(2, 2, 2)
+    theoretical_fibonacci = edges + vertices * np.log(vertices)  # O(E + V log V)
+    # Normalize for comparison
+    theoretical_fibonacci = theoretical_fibonacci * (max(results['fibonacci_time']) / max(theoretical_fibonacci))
+    
+    plt.plot(results['sizes'], results['fibonacci_time'], 'g-', marker='o', label='Empirique')
+    plt.plot(results['sizes'], theoretical_fibonacci, 'g--', label='Théorique O(E + V log V)')
+    plt.title('Dijkstra avec Tas de Fibonacci')
+    plt.xlabel('Taille du graphe')
+    plt.ylabel('Temps (secondes)')
+    plt.legend()
+    plt.grid(True)
+    
+    # Plot 3: Bellman-Ford
+    plt.subplot(2, 2, 3)
+    theoretical_bellman = vertices * edges  # O(V * E)
+    # Normalize for comparison
+    theoretical_bellman = theoretical_bellman * (max(results['bellman_ford_time']) / max(theoretical_bellman))
+    
+    plt.plot(results['sizes'], results['bellman_ford_time'], 'r-', marker='o', label='Empirique')
+    plt.plot(results['sizes'], theoretical_bellman, 'r--', label='Théorique O(V * E)')
+    plt.title('Bellman-Ford')
+    plt.xlabel('Taille du graphe')
+    plt.ylabel('Temps (secondes)')
+    plt.legend()
+    plt.grid(True)
+    
+    # Plot 4: Comparison of all algorithms
+    plt.subplot(2, 2, 4)
+    plt.plot(results['sizes'], results['minheap_time'], 'b-', marker='o', label='Dijkstra Tas Binaire')
+    plt.plot(results['sizes'], results['fibonacci_time'], 'g-', marker='o', label='Dijkstra Tas Fibonacci')
+    plt.plot(results['sizes'], results['bellman_ford_time'], 'r-', marker='o', label='Bellman-Ford')
+    plt.title('Comparaison des Algorithmes')
+    plt.xlabel('Taille du graphe')
+    plt.ylabel('Temps (secondes)')
+    plt.legend()
+    plt.grid(True)
+    
+    plt.tight_layout()
+    plt.savefig(file_path, dpi=300)
+    plt.close()
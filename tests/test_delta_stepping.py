@@ -0,0 +1,63 @@
+import math
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from pcc.delta_stepping import CSRGraph, DeltaStepping, delta_stepping
+from pcc.dijkstra_minheap import dijkstra
+
+
+def random_graph(seed, size=60, edges=200):
+    rng = random.Random(seed)
+    graph = {i: [] for i in range(size)}
+    for _ in range(edges):
+        u, v = rng.randrange(size), rng.randrange(size)
+        weight = rng.choice([0, rng.random() * 10, rng.randint(1, 100)])
+        graph[u].append((v, weight))
+        graph[v].append((u, weight))
+    return graph
+
+
+def assert_same_distances(graph, start, distances, previous_nodes):
+    expected, _ = dijkstra(graph, start)
+    for node in graph:
+        assert math.isclose(distances[node], expected[node]) or distances[node] == expected[node]
+        if previous_nodes[node] is not None:
+            assert any(v == node and math.isclose(distances[previous_nodes[node]] + w, distances[node])
+                       for v, w in graph[previous_nodes[node]])
+
+
+@pytest.mark.parametrize('delta', [None, 0.5, 5, 50])
+def test_matches_dijkstra(delta):
+    for seed in range(50):
+        graph = random_graph(seed)
+        assert_same_distances(graph, 0, *delta_stepping(graph, 0, delta=delta))
+
+
+@pytest.mark.parametrize('backend', ['numpy', 'processes'])
+def test_engine_reused_across_queries(backend):
+    graph = random_graph(1, size=500, edges=2000)
+    with DeltaStepping(CSRGraph.from_graph(graph), backend=backend, processes=2,
+                       min_parallel_edges=10) as engine:
+        for start in (0, 17, 250, 0):
+            assert_same_distances(graph, start, *engine.shortest_paths(start))
+
+
+def test_from_edges_sorts_by_source():
+    csr = CSRGraph.from_edges(['a', 'b', 'c'], [2, 0, 0], [0, 1, 2], [3.0, 1.0, 2.0])
+    assert csr.indptr.tolist() == [0, 2, 2, 3]
+    assert csr.indices.tolist() == [1, 2, 0]
+    assert csr.weights.tolist() == [1.0, 2.0, 3.0]
+
+
+@pytest.mark.parametrize('delta', [0, -1, float('nan')])
+def test_rejects_non_positive_delta(delta):
+    with pytest.raises(ValueError):
+        delta_stepping({'a': [('b', 1)], 'b': []}, 'a', delta=delta)
+
+
+def test_rejects_negative_weights():
+    with pytest.raises(ValueError):
+        delta_stepping({'a': [('b', -1)], 'b': []}, 'a')
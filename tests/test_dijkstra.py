@@ -0,0 +1,32 @@
+from pcc.bellman_ford import bellman_ford
+from pcc.dijkstra_fibo import dijkstra_fibonacci
+from pcc.dijkstra_minheap import dijkstra
+from pcc.instrumentation import OperationCounters
+
+# b is queued at distance 4 from s, then drops to 2 through a before it is
+# popped: its neighbour c is only reached if b is queued again
+GRAPH = {
+    's': [('a', 1), ('b', 4)],
+    'a': [('b', 1)],
+    'b': [('c', 1)],
+    'c': [],
+}
+
+
+def test_queued_node_improved_before_pop():
+    expected, _ = bellman_ford(GRAPH, 's')
+    assert expected == {'s': 0, 'a': 1, 'b': 2, 'c': 3}
+
+    for engine in (dijkstra, dijkstra_fibonacci):
+        distances, previous_nodes = engine(GRAPH, 's')
+        assert distances == expected
+        assert previous_nodes == {'s': None, 'a': 's', 'b': 'a', 'c': 'b'}
+
+
+def test_counters_record_the_lazy_decrease_key():
+    counters = OperationCounters()
+    dijkstra(GRAPH, 's', counters)
+    assert counters.decrease_keys == 1
+    assert counters.stale_pops == 1
+    assert counters.settled == 4
+    assert counters.pushes == counters.pops == 5
@@ -0,0 +1,78 @@
+import os
+import random
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from pcc import gtfs_ingest
+from pcc.gtfs_ingest import _chunk_bounds, load_stop_times_parallel
+from pcc.loader import load_stop_times
+
+HEADER = 'trip_id,arrival_time,departure_time,stop_id,stop_sequence\n'
+
+
+def write_feed(path, shuffle, seed=0, trips=60):
+    rng = random.Random(seed)
+    rows = []
+    for trip in range(trips):
+        seconds = rng.randint(5, 20) * 3600
+        for sequence, stop in enumerate(rng.sample(range(25), 8)):
+            seconds += rng.choice([0, 60, rng.randint(60, 300)])
+            time = f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+            rows.append(f"T{trip},{time},{time},S{stop},{sequence + 1}\n")
+    if shuffle:
+        rng.shuffle(rows)
+    path.write_text(HEADER + ''.join(rows))
+    return str(path)
+
+
+def assert_same_graph(expected, graph):
+    assert set(graph) == set(expected)
+    for stop in expected:
+        assert sorted(graph[stop]) == sorted(expected[stop])
+
+
+@pytest.mark.parametrize('shuffle', [False, True])
+@pytest.mark.parametrize('processes', [1, 3])
+@pytest.mark.parametrize('chunk_size', [100, 1000, 1 << 20])
+def test_matches_load_stop_times(tmp_path, monkeypatch, shuffle, processes, chunk_size):
+    file_path = write_feed(tmp_path / 'stop_times.txt', shuffle)
+    if chunk_size == 100:
+        # Trips of 8 rows are about 300 bytes: every trip spans chunks
+        chunks = os.path.getsize(file_path) // chunk_size
+        assert len(_chunk_bounds(file_path, chunks)[1]) > 2 * 60
+
+    # Grouped rows are linked by the workers; shuffled rows spread over
+    # several chunks make them parse again for the main process to link
+    linked_elsewhere = []
+    check = gtfs_ingest._linked_elsewhere
+    monkeypatch.setattr(gtfs_ingest, '_linked_elsewhere',
+                        lambda parsed: linked_elsewhere.append(check(parsed)) or linked_elsewhere[0])
+
+    assert_same_graph(load_stop_times(file_path),
+                      load_stop_times_parallel(file_path, processes, chunk_size))
+    several_chunks = max(os.path.getsize(file_path) // chunk_size, processes) > 1
+    assert linked_elsewhere == [shuffle and several_chunks]
+
+
+def test_trip_split_across_chunks_and_duplicate_edges(tmp_path):
+    rows = [
+        'A,08:00:00,08:00:00,S1,1\n',
+        'A,08:02:00,08:02:00,S2,2\n',
+        'A,08:05:00,08:05:00,S3,3\n',
+        # S2 -> S1 is the same undirected edge as S1 -> S2, shorter here
+        'B,09:00:00,09:00:00,S2,1\n',
+        'B,09:01:00,09:01:00,S1,2\n',
+        'C,10:00:00,10:00:00,S1,1\n',
+        'C,10:04:00,10:04:00,S2,2\n',
+    ]
+    file_path = tmp_path / 'stop_times.txt'
+    file_path.write_text(HEADER + ''.join(rows))
+
+    # A chunk per row: every trip is split between chunks
+    graph = load_stop_times_parallel(str(file_path), processes=1, chunk_size=20)
+    assert sorted(graph['S1']) == [('S2', 1.0)]
+    assert sorted(graph['S2']) == [('S1', 1.0), ('S3', 3.0)]
+    assert graph['S3'] == [('S2', 3.0)]
+    assert_same_graph(load_stop_times(str(file_path)), graph)
@@ -0,0 +1,60 @@
+import itertools
+import random
+
+from pcc.k_shortest import _reverse_tree, penalty_alternatives, yen_k_shortest_paths
+
+
+def all_simple_paths(graph, source, target):
+    paths = []
+
+    def extend(path, cost):
+        if path[-1] == target:
+            paths.append((cost, list(path)))
+            return
+        for neighbor, weight in graph[path[-1]]:
+            if neighbor not in path:
+                path.append(neighbor)
+                extend(path, cost + weight)
+                path.pop()
+
+    extend([source], 0)
+    return sorted(paths)
+
+
+def random_graph(seed):
+    rng = random.Random(seed)
+    nodes = [str(i) for i in range(rng.randint(2, 8))]
+    return {u: [(v, rng.randint(0, 9)) for v in nodes if v != u and rng.random() < 0.4]
+            for u in nodes}, nodes[0], nodes[-1]
+
+
+def test_yen_matches_brute_force():
+    for seed in range(200):
+        graph, source, target = random_graph(seed)
+        expected = all_simple_paths(graph, source, target)
+        for k in (1, 3, 6):
+            paths = yen_k_shortest_paths(graph, source, target, k)
+            assert [cost for cost, _ in paths] == [cost for cost, _ in expected[:k]]
+            assert all(path in expected for path in paths)
+
+
+def test_budget_returns_a_prefix_of_the_shortest_paths():
+    for seed, budget in itertools.product(range(100), range(12)):
+        graph, source, target = random_graph(seed)
+        expected = all_simple_paths(graph, source, target)
+        paths = yen_k_shortest_paths(graph, source, target, 4, max_settled=budget)
+        assert [cost for cost, _ in paths] == [cost for cost, _ in expected[:len(paths)]]
+        for path in penalty_alternatives(graph, source, target, 3, max_settled=budget):
+            assert path in expected
+
+
+def test_budget_counts_reverse_tree_and_keeps_path_found_on_exact_budget():
+    graph = {'s': [('a', 1), ('b', 1)], 'a': [('t', 1)], 'b': [('t', 2)], 't': []}
+    tree_settled = _reverse_tree(graph, 't', 's')[3]
+
+    # Spur search from s settles s, b and t; the one from a settles a only
+    exact = tree_settled + 3 + 1
+    assert yen_k_shortest_paths(graph, 's', 't', 2, max_settled=exact) == [
+        (2, ['s', 'a', 't']), (3, ['s', 'b', 't'])]
+    assert yen_k_shortest_paths(graph, 's', 't', 2, max_settled=exact - 1) == [
+        (2, ['s', 'a', 't'])]